@@ -10,6 +10,11 @@ import datetime # 날짜 및 시간 모듈
 import ffmpeg # 동영상 처리를 위한 FFmpeg 모듈
 import glob # 파일 및 폴더 검색 모듈
 import re # 정규 표현식 모듈
+import hashlib # 파일 해시 계산 모듈
+import struct # 바이너리 헤더 해석 모듈
+import tempfile # 임시 파일 및 폴더 생성 모듈
+import shutil # 폴더 삭제 모듈
+from concurrent.futures import ThreadPoolExecutor # 병렬 작업 실행을 위한 모듈
 
 # Maya API 작업을 수행하는 클래스를 정의
 class MayaAPI():
@@ -156,10 +161,11 @@ class MayaAPI():
 
 ################### 플레이블라스트, 렌더, ffmpeg ########################################
     
-    def make_playblast(self, image_path):
+    def make_playblast(self, image_path, start_frame=None, last_frame=None):
         """
         마야의 플레이 블라스트 기능을 이용해서 뷰포트를 이미지로 렌더링하고,
         슬레이트 정보를 삽입하여 동영상을 인코딩한다.
+        start_frame, last_frame 을 지정하지 않으면 타임라인 전체 구간을 사용한다.
         """
         # 이미지 파일의 경로에서 확장자를 분리하고 저장 경로 설정
         proxy_path = ''.join(image_path.split('.')[0])
@@ -170,9 +176,11 @@ class MayaAPI():
         print (f"proxy path :{proxy_path}")
         print (f"proxy format :{proxy_format}")
 
-        # 마야 타임라인에서 시작 프레임과 끝 프레임을 가져옴
-        start_frame = int(cmds.playbackOptions(query=True, min=True))
-        last_frame = int(cmds.playbackOptions(query=True, max=True))
+        # 구간이 지정되지 않았으면 마야 타임라인에서 시작 프레임과 끝 프레임을 가져옴
+        if start_frame is None:
+            start_frame = int(cmds.playbackOptions(query=True, min=True))
+        if last_frame is None:
+            last_frame = int(cmds.playbackOptions(query=True, max=True))
 
         # 렌더 해상도 설정 (1920x1080)
         render_width = 1920
@@ -187,8 +195,10 @@ class MayaAPI():
         # 시작 프레임과 마지막 프레임 반환
         return start_frame, last_frame
     
-    def make_ffmpeg(self, start_frame, last_frame, input_path, output_path, project_name):
+    def make_ffmpeg(self, start_frame, last_frame, input_path, output_path, project_name, verify=True):
         ## 플레이블라스트로 렌더링한 이미지를 FFMPEG 라이브러리를 이용해서 동영상을 인코딩한다.
+        ## verify 가 True 이면 인코딩 전에 start_frame ~ last_frame 구간의 프레임을 검증하고,
+        ## 누락/손상된 프레임이 있으면 인코딩하지 않는다.
 
         # 기본 설정
         first = 1001
@@ -196,23 +206,15 @@ class MayaAPI():
         # 사운드가 있는 경우 23.976 으로 합니다.
         # 이 경우 ffmpeg에 사운드 파일을 추가하는 설정이 필요합니다.
         ffmpeg = "ffmpeg"
-        slate_size = 60 # 슬레이트의 높이
-        font_path = "/home/rapa/baked/toolkit/config/core/content/font/Courier_New.ttf" # 슬레이트에 사용할 폰트
+        # 검증에는 호출한 쪽이 기대하는 구간을 사용 (앞/뒤 프레임 누락 검출)
+        expected_start = int(start_frame) if start_frame is not None else None
+        expected_last = int(last_frame) if last_frame is not None else None
         start_frame, last_frame = self.get_frame_number(input_path)
         frame_count = int(last_frame) - int(start_frame) # 총 프레임 수 계산
-        font_size = 40
-        text_x_padding = 10
-        text_y_padding = 20
 
-        # 슬레이트의 각 위치에 들어갈 텍스트 설정
-        top_left, _ = os.path.splitext(os.path.basename(output_path))  # 상단 왼쪽 텍스트: 출력 파일 이름
-        top_center = project_name  # 상단 중앙 텍스트: 프로젝트 이름
-        top_right = datetime.date.today().strftime("%Y/%m/%d")  # 상단 오른쪽 텍스트: 오늘 날짜
-        bot_left = "1920x1080"  # 하단 왼쪽 텍스트: 해상도
-        bot_center = ""  # 하단 중앙은 빈칸
-        frame_cmd = "'Frame \: %{eif\:n+"  # 프레임 번호 표시
-        frame_cmd += "%s\:d}' (%s)"  % (start_frame, frame_count+1)
-        bot_right = frame_cmd  # 하단 오른쪽에 프레임 정보 추가
+        # 슬레이트 상단 왼쪽에 들어갈 출력 파일 이름
+        title, _ = os.path.splitext(os.path.basename(output_path))
+        slate_filter = self.get_slate_filter(title, project_name, start_frame, frame_count+1)
 
         try:
             input_path = input_path.replace(".####.", ".%04d.")  # 파일 경로에서 프레임 번호를 변환
@@ -222,22 +224,54 @@ class MayaAPI():
         if last_frame == 1:
             return # 렌더링할 프레임이 없으면 종료
         
+        # 누락/손상된 프레임이 있으면 인코딩하지 않고 종료
+        if expected_start is None:
+            expected_start = int(start_frame)
+        if expected_last is None:
+            expected_last = int(last_frame)
+        if verify and not self.verify_render_sequence(input_path, expected_start, expected_last):
+            return
+
         # FFMPEG 명령어를 구성해 동영상 인코딩 수행
         cmd = '%s -framerate %s -y -start_number %s ' % (ffmpeg, frame_rate, start_frame)
         cmd += '-i %s' % (input_path)
-        cmd += ' -vf "drawbox=y=0 :color=black :width=iw: height=%s :t=fill, ' % (slate_size)
-        cmd += 'drawbox=y=ih-%s :color=black :width=iw: height=%s :t=fill, ' % (slate_size, slate_size)
-        cmd += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=%s :y=%s,' % (font_path, font_size, top_left, text_x_padding, text_y_padding)
-        cmd += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=(w-text_w)/2 :y=%s,' % (font_path, font_size, top_center, text_y_padding)
-        cmd += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=w-tw-%s :y=%s,' % (font_path, font_size, top_right, text_x_padding, text_y_padding)
-        cmd += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=%s :y=h-th-%s,' % (font_path, font_size, bot_left, text_x_padding, text_y_padding)
-        cmd += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=(w-text_w)/2 :y=h-th-%s,' % (font_path, font_size, bot_center, text_y_padding)
-        cmd += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=w-tw-%s :y=h-th-%s' % (font_path, font_size, bot_right, text_x_padding, text_y_padding)
-        cmd += '"'
+        cmd += ' -vf "%s"' % (slate_filter)
         cmd += ' -c:v prores_ks -profile:v 3 -colorspace bt709 %s' % output_path
         os.system(cmd) # 명령어 실행
         return output_path
     
+    def get_slate_filter(self, title, project_name, start_frame, frame_total):
+        """
+        슬레이트(상/하단 검은 띠와 텍스트)를 그리는 ffmpeg 비디오 필터 문자열을 만든다.
+        프레임 번호는 입력의 첫 프레임을 start_frame 으로 하여 표시하고,
+        괄호 안에는 전체 프레임 수(frame_total)를 표시한다.
+        """
+        slate_size = 60 # 슬레이트의 높이
+        font_path = "/home/rapa/baked/toolkit/config/core/content/font/Courier_New.ttf" # 슬레이트에 사용할 폰트
+        font_size = 40
+        text_x_padding = 10
+        text_y_padding = 20
+
+        # 슬레이트의 각 위치에 들어갈 텍스트 설정
+        top_left = title  # 상단 왼쪽 텍스트: 출력 파일 이름
+        top_center = project_name  # 상단 중앙 텍스트: 프로젝트 이름
+        top_right = datetime.date.today().strftime("%Y/%m/%d")  # 상단 오른쪽 텍스트: 오늘 날짜
+        bot_left = "1920x1080"  # 하단 왼쪽 텍스트: 해상도
+        bot_center = ""  # 하단 중앙은 빈칸
+        frame_cmd = "'Frame \\: %{eif\\:n+"  # 프레임 번호 표시
+        frame_cmd += "%s\\:d}' (%s)"  % (start_frame, frame_total)
+        bot_right = frame_cmd  # 하단 오른쪽에 프레임 정보 추가
+
+        vf = 'drawbox=y=0 :color=black :width=iw: height=%s :t=fill, ' % (slate_size)
+        vf += 'drawbox=y=ih-%s :color=black :width=iw: height=%s :t=fill, ' % (slate_size, slate_size)
+        vf += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=%s :y=%s,' % (font_path, font_size, top_left, text_x_padding, text_y_padding)
+        vf += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=(w-text_w)/2 :y=%s,' % (font_path, font_size, top_center, text_y_padding)
+        vf += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=w-tw-%s :y=%s,' % (font_path, font_size, top_right, text_x_padding, text_y_padding)
+        vf += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=%s :y=h-th-%s,' % (font_path, font_size, bot_left, text_x_padding, text_y_padding)
+        vf += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=(w-text_w)/2 :y=h-th-%s,' % (font_path, font_size, bot_center, text_y_padding)
+        vf += 'drawtext=fontfile=%s :fontsize=%s :fontcolor=white@0.7 :text=%s :x=w-tw-%s :y=h-th-%s' % (font_path, font_size, bot_right, text_x_padding, text_y_padding)
+        return vf
+
     def get_frame_number(self, path):
         """
         파일 경로에서 프레임 번호를 추출하여 시작과 끝 프레임 번호를 반환한다.
@@ -265,6 +299,209 @@ class MayaAPI():
         print(p_start, p_last)      
         return p_start, p_last  # 시작과 끝 프레임 번호 반환
 
+    def split_frame_range(self, start_frame, last_frame, shard_count):
+        """
+        start_frame ~ last_frame 구간을 최대 shard_count 개의 연속된 구간으로 나눈다.
+        남는 프레임은 앞쪽 구간부터 한 프레임씩 더 배정한다.
+
+        Returns:
+        list: (구간 시작 프레임, 구간 끝 프레임) 튜플의 리스트
+        """
+        frame_total = int(last_frame) - int(start_frame) + 1
+        if frame_total < 1:
+            return []
+        shard_count = max(1, min(int(shard_count), frame_total)) # 구간 수는 프레임 수를 넘지 않음
+        base, remainder = divmod(frame_total, shard_count)
+
+        shards = []
+        shard_start = int(start_frame)
+        for index in range(shard_count):
+            shard_size = base + (1 if index < remainder else 0)
+            shards.append((shard_start, shard_start + shard_size - 1))
+            shard_start += shard_size
+        return shards
+
+    def run_playblast_worker(self, scene_path, image_path, start_frame, last_frame, camera):
+        """
+        배치 렌더러(Render -r hw2, Viewport 2.0)로 같은 씬을 열어 지정한 구간만 렌더링한다.
+        playblast 는 뷰포트(UI)가 필요해서 헤드리스 워커에서는 쓸 수 없기 때문에
+        배치 모드에서 지원되는 하드웨어 렌더러로 name.####.ext 시퀀스를 만든다.
+        make_sharded_playblast 의 기본 캡처 함수로 사용된다.
+        """
+        image_dir = os.path.dirname(image_path)
+        image_name = os.path.basename(image_path).split('.')[0]  # make_playblast 와 같은 이름 규칙
+        _, image_format = os.path.splitext(image_path)
+
+        command = [
+            'Render', '-r', 'hw2',
+            '-s', str(start_frame), '-e', str(last_frame),  # 렌더링할 구간
+            '-cam', camera,
+            '-x', '1920', '-y', '1080',
+            '-rd', image_dir,           # 출력 폴더
+            '-im', image_name,          # 출력 이미지 이름
+            '-of', image_format[1:],    # 출력 이미지 형식
+            '-fnc', 'name.#.ext',       # name.####.ext 형태로 저장
+            '-pad', '4',
+            scene_path
+        ]
+        subprocess.run(command, check=True)  # 구간별 헤드리스 렌더링 실행
+
+    def check_shard_frames(self, image_path, start_frame, last_frame):
+        """
+        워커가 start_frame ~ last_frame 구간의 프레임을 모두 만들었는지 확인한다.
+        빠지거나 비어있는 프레임이 있으면 RuntimeError 를 발생시킨다.
+        """
+        bad_frames = []
+        for frame in range(int(start_frame), int(last_frame) + 1):
+            frame_path = image_path.replace("####", "%04d" % frame)
+            if not os.path.isfile(frame_path) or os.path.getsize(frame_path) == 0:
+                bad_frames.append(frame)
+        if bad_frames:
+            raise RuntimeError(f"{start_frame}-{last_frame} 구간 캡처 결과에 없거나 비어있는 프레임: {bad_frames}")
+
+    def encode_segment(self, image_path, segment_path, start_frame, last_frame, title, project_name, slate_start, frame_total):
+        """
+        이미지 시퀀스의 start_frame ~ last_frame 구간만 ProRes 세그먼트로 인코딩한다.
+        슬레이트 프레임 번호는 slate_start 부터 이어지고, 전체 프레임 수는 frame_total 로 표시된다.
+        """
+        frame_rate = 24
+        input_path = image_path.replace(".####.", ".%04d.")  # 파일 경로에서 프레임 번호를 변환
+        slate_filter = self.get_slate_filter(title, project_name, slate_start, frame_total)
+
+        command = [
+            'ffmpeg', '-y',
+            '-framerate', str(frame_rate),
+            '-start_number', str(start_frame),   # 세그먼트 첫 프레임
+            '-i', input_path,
+            '-frames:v', str(int(last_frame) - int(start_frame) + 1),  # 세그먼트 프레임 수
+            '-vf', slate_filter,
+            '-c:v', 'prores_ks', '-profile:v', '3', '-colorspace', 'bt709',
+            segment_path
+        ]
+        subprocess.run(command, check=True)  # FFMPEG 명령 실행
+        return segment_path
+
+    def concat_segments(self, segment_paths, output_path):
+        """
+        ffmpeg concat demuxer 로 세그먼트들을 다시 인코딩하지 않고(-c copy) 하나의 동영상으로 합친다.
+        """
+        list_path = os.path.join(os.path.dirname(segment_paths[0]), "segments.txt")  # 세그먼트 폴더 안에 목록 작성
+        with open(list_path, 'w') as f:
+            for segment_path in segment_paths:
+                escaped = os.path.abspath(segment_path).replace("'", "'\\''")  # concat 목록의 작은따옴표 이스케이프
+                f.write(f"file '{escaped}'\n")
+
+        command = [
+            'ffmpeg', '-y',
+            '-f', 'concat', '-safe', '0',
+            '-i', list_path,
+            '-c', 'copy',   # 재인코딩 없이 스트림 복사
+            output_path
+        ]
+        try:
+            subprocess.run(command, check=True)  # FFMPEG 명령 실행
+        finally:
+            os.remove(list_path)
+        return output_path
+
+    def make_sharded_playblast(self, image_path, output_path, project_name, shard_count=4,
+                               start_frame=None, last_frame=None, scene_path=None, camera=None, capture_func=None):
+        """
+        타임라인을 shard_count 개 구간으로 나누어 구간마다 별도의 헤드리스 워커에서
+        플레이블라스트와 인코딩을 병렬로 수행한 뒤, 세그먼트를 재인코딩 없이 이어 붙인다.
+        슬레이트의 프레임 번호는 세그먼트가 바뀌어도 끊기지 않고 이어진다.
+
+        Args:
+        image_path (str): 플레이블라스트 이미지 경로 (예: /path/name.####.jpg)
+        output_path (str): 최종 동영상 경로 (.mov)
+        project_name (str): 슬레이트에 표시할 프로젝트 이름
+        shard_count (int): 나눌 구간(워커) 수
+        start_frame, last_frame (int): 구간 (None 이면 타임라인에서 읽음)
+        scene_path (str): 워커가 열 씬 경로 (None 이면 현재 열린 씬, 저장되지 않은 변경이 있으면 중단)
+        camera (str): 워커가 캡처할 카메라 (None 이면 현재 뷰포트의 카메라)
+        capture_func (callable): capture_func(scene_path, image_path, start, last) 형태의 캡처 함수.
+                                 None 이면 배치 렌더 워커(run_playblast_worker)를 사용한다.
+
+        Maya 밖에서 capture_func 로 실행하려면 scene_path, start_frame, last_frame 을 모두 지정해야 한다.
+        (지정하지 않으면 cmds 로 씬/타임라인을 조회함) 예:
+            def fake_capture(scene_path, image_path, start, last):
+                for frame in range(start, last + 1):
+                    subprocess.run(['ffmpeg', '-y', '-f', 'lavfi', '-i', 'testsrc=size=1920x1080',
+                                    '-frames:v', '1', image_path.replace('####', '%04d' % frame)], check=True)
+            MayaAPI().make_sharded_playblast('/tmp/pb/shot.####.jpg', '/tmp/shot.mov', 'test',
+                                             start_frame=1001, last_frame=1096, scene_path='shot.mb',
+                                             capture_func=fake_capture)
+
+        Returns:
+        str: 최종 동영상 경로. 캡처/인코딩/합치기 중 어떤 에러가 나도 메시지를 출력하고 None 을 반환한다.
+        """
+        if start_frame is None:
+            start_frame = int(cmds.playbackOptions(query=True, min=True))
+        if last_frame is None:
+            last_frame = int(cmds.playbackOptions(query=True, max=True))
+        if scene_path is None:
+            # 워커는 저장된 씬을 열기 때문에 저장되지 않은 변경이 있으면 예전 애니메이션이 캡처됨
+            if cmds.file(q=True, modified=True):
+                print("Error: 씬에 저장되지 않은 변경이 있습니다. 저장한 뒤 다시 실행하세요.")
+                return
+            scene_path = cmds.file(q=True, sn=True)  # 현재 씬 경로 사용
+
+        if not scene_path:
+            print("Error: 씬이 저장되어 있지 않아 플레이블라스트 워커를 실행할 수 없습니다.")
+            return
+
+        if capture_func is None:
+            if camera is None:
+                panel = cmds.getPanel(withFocus=True)
+                if cmds.getPanel(typeOf=panel) != "modelPanel":
+                    print("Error: 캡처할 카메라를 찾을 수 없습니다. camera 를 지정하세요.")
+                    return
+                camera = cmds.modelPanel(panel, q=True, camera=True)  # 현재 뷰포트의 카메라
+
+            def capture_func(scene_path, image_path, start, last):
+                self.run_playblast_worker(scene_path, image_path, start, last, camera)
+
+        shards = self.split_frame_range(start_frame, last_frame, shard_count)
+        if not shards:
+            print("Error: 플레이블라스트할 프레임이 없습니다.")
+            return
+
+        frame_total = int(last_frame) - int(start_frame) + 1
+        title, _ = os.path.splitext(os.path.basename(output_path))  # 슬레이트 상단 왼쪽: 최종 파일 이름
+        _, output_ext = os.path.splitext(output_path)
+        print(f"플레이블라스트 구간: {shards}")
+
+        segment_dir = tempfile.mkdtemp(prefix=f".{title}_segments_", dir=os.path.dirname(os.path.abspath(output_path)))
+
+        def render_shard(index, shard):
+            # 구간 캡처 후 바로 해당 구간만 인코딩
+            shard_start, shard_last = shard
+            capture_func(scene_path, image_path, shard_start, shard_last)
+            self.check_shard_frames(image_path, shard_start, shard_last)  # 캡처 실패를 인코딩 전에 확인
+            segment_path = os.path.join(segment_dir, f"{title}_{index:03d}{output_ext}")
+            return self.encode_segment(image_path, segment_path, shard_start, shard_last,
+                                       title, project_name, shard_start, frame_total)
+
+        try:
+            with ThreadPoolExecutor(max_workers=len(shards)) as executor:
+                futures = [executor.submit(render_shard, index, shard) for index, shard in enumerate(shards)]
+                segment_paths = [future.result() for future in futures]  # 구간 순서대로 결과 수집
+            # 합치기 전에 전체 구간의 누락/손상 프레임 검사
+            if not self.verify_render_sequence(image_path, int(start_frame), int(last_frame)):
+                raise RuntimeError(f"프레임 검증 실패: {image_path}")
+            self.concat_segments(segment_paths, output_path)
+            print(f"분할 플레이블라스트 완료: {output_path}")
+
+        except Exception as e:
+            print(f"분할 플레이블라스트 실패: {e}")
+            return
+
+        finally:
+            # 세그먼트 임시 파일 정리
+            shutil.rmtree(segment_dir, ignore_errors=True)
+
+        return output_path
+
 ################################## 매치무브 ###################################3
 
     def get_undistortion_size(self):
@@ -349,6 +586,14 @@ class MayaAPI():
         cmds.setAttr("defaultRenderGlobals.animation", 1)  # 애니메이션 렌더링 활성화
         cmds.setAttr("defaultRenderGlobals.putFrameBeforeExt", 1)  # 프레임 번호를 확장자 앞에 배치
         cmds.arnoldRender(batch=True)  # Arnold 렌더러로 배치 렌더링 실행
+
+        # 누락/손상된 EXR 이 있으면 썸네일을 만들지 않고 종료
+        scene_name, _ = os.path.splitext(self.get_file_name())  # <Scene> 토큰 = 확장자를 뺀 씬 이름
+        start_frame = int(cmds.getAttr("defaultRenderGlobals.startFrame"))
+        last_frame = int(cmds.getAttr("defaultRenderGlobals.endFrame"))
+        if not self.verify_render_sequence(f"{output_dir}{scene_name}.####.exr", start_frame, last_frame):
+            return
+
         thumbnail_path = self.convert_exr_into_jpg(outpath)  # 렌더된 EXR 파일을 JPG로 변환
         return thumbnail_path
 
@@ -379,6 +624,293 @@ class MayaAPI():
         
         return output_file  # 변환된 JPG 파일 경로 반환        
 
+###### 렌더 결과 검증 ###########################################################
+
+    # EXR 압축 방식별 청크당 스캔라인 수 (NONE, RLE, ZIPS, ZIP, PIZ, PXR24, B44, B44A, DWAA, DWAB)
+    EXR_LINES_PER_CHUNK = {0: 1, 1: 1, 2: 1, 3: 16, 4: 32, 5: 16, 6: 32, 7: 32, 8: 32, 9: 256}
+
+    def get_manifest_path(self, sequence_path):
+        """
+        시퀀스 경로(/path/name.####.exr)에 대응하는 매니페스트 파일 경로를 반환한다.
+        glob("*") 에 잡히지 않도록 같은 폴더의 숨김 파일(.name.ext.manifest.json)로 둔다.
+        같은 이름의 jpg/exr 시퀀스가 한 폴더에 있어도 겹치지 않도록 확장자를 이름에 포함한다.
+        """
+        sequence_path = sequence_path.replace(".%04d.", ".####.")
+        dir_path = os.path.dirname(sequence_path)
+        name, ext = os.path.basename(sequence_path).split(".####")[:2]
+        return f"{dir_path}/.{name}{ext}.manifest.json"
+
+    def hash_frame(self, file_path, chunk_size=1024 * 1024):
+        """
+        파일을 chunk_size 단위로 나누어 읽으면서 md5 해시를 계산한다.
+        """
+        md5 = hashlib.md5()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(chunk_size), b''):
+                md5.update(chunk)
+        return md5.hexdigest()
+
+    def check_frame_header(self, file_path, size):
+        """
+        확장자에 맞는 헤더(매직 넘버)와 파일 끝을 확인하여 이미지가 온전한지 검사한다.
+        EXR 은 오프셋 테이블과 마지막 청크가 파일 안에 모두 들어있는지까지 확인한다.
+        """
+        if size == 0:
+            return False
+
+        ext = os.path.splitext(file_path)[1].lower()
+        with open(file_path, 'rb') as f:
+            head = f.read(8)
+            f.seek(max(0, size - 32))
+            tail = f.read()
+
+        if ext == ".exr":
+            if head[:4] != b'\x76\x2f\x31\x01':
+                return False
+            return self._check_exr_chunks(file_path, size)
+        if ext in (".jpg", ".jpeg"):
+            return head[:2] == b'\xff\xd8' and b'\xff\xd9' in tail  # SOI 로 시작해서 EOI 로 끝나야 함
+        if ext == ".png":
+            return head == b'\x89PNG\r\n\x1a\n' and tail.endswith(b'IEND\xaeB`\x82')
+        if ext in (".tif", ".tiff"):
+            return head[:4] in (b'II*\x00', b'MM\x00*')
+        return True  # 알 수 없는 형식은 크기만 확인
+
+    def _check_exr_chunks(self, file_path, size):
+        """
+        싱글 파트 스캔라인 EXR 의 헤더를 읽어 오프셋 테이블을 확인한다.
+        렌더가 중간에 죽으면 오프셋이 0 으로 남거나 마지막 청크가 잘리기 때문에 이를 검사한다.
+        타일/멀티파트/딥 EXR 은 매직 넘버만 확인한다.
+        """
+        def read_string(f):
+            # null 로 끝나는 헤더 문자열 읽기
+            data = b''
+            while len(data) < 256:
+                char = f.read(1)
+                if not char:
+                    return None
+                if char == b'\x00':
+                    return data
+                data += char
+            return None
+
+        try:
+            with open(file_path, 'rb') as f:
+                f.seek(4)
+                version_bytes = f.read(4)
+                if len(version_bytes) < 4:
+                    return False
+                version = struct.unpack('<I', version_bytes)[0]
+                if version & 0x1a00:  # tiled(0x200), deep(0x800), multipart(0x1000)
+                    return True
+
+                data_window = None
+                compression = None
+                while True:
+                    name = read_string(f)
+                    if name is None:
+                        return False  # 헤더 도중 파일이 끝남
+                    if name == b'':
+                        break  # 헤더 끝
+                    if read_string(f) is None:
+                        return False
+                    size_bytes = f.read(4)
+                    if len(size_bytes) < 4:
+                        return False
+                    value_size = struct.unpack('<i', size_bytes)[0]
+                    if value_size < 0 or value_size > size:
+                        return False
+                    value = f.read(value_size)
+                    if len(value) < value_size:
+                        return False
+                    if name == b'dataWindow':
+                        if value_size != 16:
+                            return False
+                        data_window = struct.unpack('<iiii', value)
+                    elif name == b'compression':
+                        if value_size != 1:
+                            return False
+                        compression = value[0]
+
+                if data_window is None or compression not in self.EXR_LINES_PER_CHUNK:
+                    return False
+
+                lines = self.EXR_LINES_PER_CHUNK[compression]
+                height = data_window[3] - data_window[1] + 1
+                if height < 1:
+                    return False
+                chunk_count = (height + lines - 1) // lines
+                if 8 * chunk_count > size:
+                    return False  # 오프셋 테이블이 파일보다 클 수 없음
+                table = f.read(8 * chunk_count)
+                if len(table) < 8 * chunk_count:
+                    return False
+
+                offsets = struct.unpack(f'<{chunk_count}Q', table)
+                if min(offsets) == 0 or max(offsets) >= size:
+                    return False
+
+                # 마지막 청크의 데이터 크기까지 파일 안에 들어있어야 함
+                f.seek(max(offsets))
+                chunk_header = f.read(8)
+                if len(chunk_header) < 8:
+                    return False
+                _, data_size = struct.unpack('<ii', chunk_header)
+                if data_size < 0:
+                    return False
+                return max(offsets) + 8 + data_size <= size
+
+        except (struct.error, IndexError, ValueError, OSError):
+            return False  # 헤더를 해석할 수 없는 파일은 손상된 것으로 처리
+
+    def build_frame_manifest(self, sequence_path, start_frame=None, last_frame=None, max_workers=8):
+        """
+        시퀀스의 모든 프레임을 병렬로 해시하여 매니페스트(frame, size, hash, valid)를 만들고 저장한다.
+        이전 매니페스트가 있으면 크기와 수정 시간이 바뀐 프레임만 다시 해시한다.
+        누락(missing), 0바이트(zero_byte), 잘린 파일(truncated), 중복 프레임(duplicate)을 함께 기록한다.
+
+        Args:
+        sequence_path (str): 시퀀스 경로 (예: /path/name.####.exr)
+        start_frame, last_frame (int): 검사할 구간 (None 이면 디스크에 있는 프레임 범위 사용)
+        max_workers (int): 동시에 해시할 프레임 수
+
+        Returns:
+        dict: 매니페스트 딕셔너리
+        """
+        sequence_path = sequence_path.replace(".%04d.", ".####.")
+        manifest_path = self.get_manifest_path(sequence_path)
+
+        # 디스크에 있는 프레임 찾기
+        p = re.compile(r"[.](\d{4})[.][^.]+$")
+        found = {}
+        head, tail = sequence_path.split("####", 1)
+        for file in glob.glob(glob.escape(head) + "[0-9]" * 4 + glob.escape(tail)):  # 경로의 [ ] 등은 그대로 매칭
+            frame = p.search(file)
+            if frame:
+                found[int(frame.group(1))] = file
+
+        if start_frame is None:
+            start_frame = min(found) if found else 0
+        if last_frame is None:
+            last_frame = max(found) if found else -1
+
+        # 이전 매니페스트 읽기
+        previous = {}
+        if os.path.exists(manifest_path):
+            try:
+                with open(manifest_path, 'r') as f:
+                    previous = {int(entry["frame"]): entry for entry in json.load(f).get("frames", [])}
+            except (ValueError, KeyError, TypeError, AttributeError, OSError) as e:
+                previous = {}
+                print(f"이전 매니페스트를 읽을 수 없어 전체를 다시 해시합니다: {e}")
+
+        entries = {}
+        to_hash = []
+        missing = []
+        for frame in range(int(start_frame), int(last_frame) + 1):
+            file = found.get(frame)
+            if file is None:
+                missing.append(frame)
+                continue
+            try:
+                stat = os.stat(file)
+            except OSError:
+                missing.append(frame)  # 검색 후 지워진 프레임
+                continue
+            entry = {"frame": frame, "path": file, "size": stat.st_size, "mtime": stat.st_mtime_ns}
+            old = previous.get(frame)
+            if (old and old.get("path") == file and old.get("size") == entry["size"]
+                    and old.get("mtime") == entry["mtime"]):
+                entry["hash"] = old.get("hash")
+                entry["valid"] = old.get("valid")  # 바뀌지 않은 프레임은 이전 결과 재사용
+            else:
+                to_hash.append(entry)
+            entries[frame] = entry
+
+        def hash_entry(entry):
+            if entry["size"] == 0:
+                return None, False
+            try:
+                return self.hash_frame(entry["path"]), self.check_frame_header(entry["path"], entry["size"])
+            except OSError as e:
+                print(f"프레임을 읽을 수 없습니다: {entry['path']} ({e})")
+                return None, False  # 읽을 수 없는 프레임은 손상된 것으로 처리
+
+        if to_hash:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                for entry, (frame_hash, valid) in zip(to_hash, executor.map(hash_entry, to_hash)):
+                    entry["hash"] = frame_hash
+                    entry["valid"] = valid
+        print(f"{len(to_hash)}개 프레임 해시, {len(entries) - len(to_hash)}개 프레임 재사용")
+
+        # 0바이트, 잘린 파일, 중복 프레임 찾기
+        zero_byte = []
+        truncated = []
+        duplicate = {}
+        first_frame_of_hash = {}
+        for frame in sorted(entries):
+            entry = entries[frame]
+            if entry["size"] == 0:
+                zero_byte.append(frame)
+            elif not entry["valid"]:
+                truncated.append(frame)
+            elif entry["hash"] in first_frame_of_hash:
+                duplicate[frame] = first_frame_of_hash[entry["hash"]]  # 같은 내용의 첫 프레임
+            else:
+                first_frame_of_hash[entry["hash"]] = frame
+
+        # 이번 구간 밖의 이전 결과는 다음 검사에서 재사용할 수 있도록 그대로 남김
+        frames = dict(entries)
+        for frame, entry in previous.items():
+            if not int(start_frame) <= frame <= int(last_frame):
+                frames[frame] = entry
+
+        manifest = {
+            "sequence": sequence_path,
+            "start_frame": int(start_frame),
+            "last_frame": int(last_frame),
+            "frames": [frames[frame] for frame in sorted(frames)],
+            "missing": missing,
+            "zero_byte": zero_byte,
+            "truncated": truncated,
+            "duplicate": duplicate,
+        }
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f, indent=4)  # 매니페스트를 JSON 파일로 저장
+        print(f"Frame manifest written to: {manifest_path}")
+        return manifest
+
+    def verify_render_sequence(self, sequence_path, start_frame=None, last_frame=None):
+        """
+        매니페스트를 만들어 문제 프레임을 출력하고, 퍼블리시해도 되는지 여부를 반환한다.
+
+        중복 프레임은 정지 동작(hold)에서도 생기기 때문에 경고만 출력하고 막지 않는다.
+
+        Returns:
+        bool: 누락/0바이트/잘린 프레임이 하나도 없으면 True
+        """
+        manifest = self.build_frame_manifest(sequence_path, start_frame, last_frame)
+        frame_total = manifest["last_frame"] - manifest["start_frame"] + 1
+        if frame_total < 1:
+            print(f"Error: 검사할 프레임이 없습니다: {sequence_path}")
+            return False
+
+        is_valid = True
+        for key, label in (("missing", "누락된 프레임"), ("zero_byte", "0바이트 프레임"),
+                           ("truncated", "잘리거나 손상된 프레임")):
+            if manifest[key]:
+                is_valid = False
+                print(f"{label}: {manifest[key]}")
+
+        if manifest["duplicate"]:
+            print(f"Warning: 중복 프레임 (카메라가 멈췄는지 확인하세요): {manifest['duplicate']}")
+
+        if is_valid:
+            print(f"프레임 검증 통과: {sequence_path} ({frame_total} frames)")
+        else:
+            print(f"Error: 프레임 검증 실패, 퍼블리시를 중단합니다: {sequence_path}")
+        return is_valid
+
 ###### 쉐이더 ###################################################################
 
     def collect_shader_assignments(self):